@@ -374,6 +374,10 @@ def _static_generate_options() -> list[click.Option]:
 
 _PLUGIN_OPTION_ATTR = "_mathtest_plugin_name"
 
+_PLAIN_ARGUMENTS_SECTION_RE = re.compile(
+    r"\nArguments:\n(?:[^\n]*\n)*?(?=\n\S|\Z)", re.IGNORECASE
+)
+
 
 def _plugin_generate_options() -> list[click.Option]:
     """Return plugin-derived Click options for the generate command."""
@@ -465,11 +469,7 @@ class _GenerateCommand(TyperCommand):
             cleaned_lines.append(line)
 
         cleaned_text = "\n".join(cleaned_lines)
-
-        plain_pattern = re.compile(
-            r"\nArguments:\n(?:[^\n]*\n)*?(?=\n\S|\Z)", re.IGNORECASE
-        )
-        cleaned_text = plain_pattern.sub("\n", cleaned_text)
+        cleaned_text = _PLAIN_ARGUMENTS_SECTION_RE.sub("\n", cleaned_text)
 
         return cleaned_text
 
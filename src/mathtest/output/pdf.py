@@ -9,20 +9,28 @@ extensible for future problem types.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 import io
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Sequence
 
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from reportlab.lib.pagesizes import letter  # type: ignore[import-untyped]
 from reportlab.lib.units import inch  # type: ignore[import-untyped]
-from reportlab.pdfgen.canvas import Canvas  # type: ignore[import-untyped]
-from reportlab.graphics import renderPDF  # type: ignore[import-untyped]
-from reportlab.graphics.shapes import Drawing  # type: ignore[import-untyped]
-from svglib.svglib import svg2rlg  # type: ignore[import-untyped]
 
 from ..interface import OutputGenerator, Problem
+from ..plugins.common import VERTICAL_SVG_PATTERN, normalize_param_keys
+
+# The canvas, font metrics, and SVG renderer dominate import time, so they are
+# imported inside the functions that use them (keeping ``mathtest --help`` fast).
+if TYPE_CHECKING:
+    from reportlab.pdfgen.canvas import Canvas  # type: ignore[import-untyped]
+    from reportlab.pdfgen.textobject import (  # type: ignore[import-untyped]
+        PDFTextObject,
+    )
+    from reportlab.graphics.shapes import Drawing  # type: ignore[import-untyped]
 
 MIN_HEADER_LABEL_FONT_SIZE = 10.0
 HEADER_LABEL_PADDING_FACTOR = 0.5
@@ -31,29 +39,141 @@ NAME_FIELD_WIDTH_RATIO = 0.5
 DATE_FIELD_WIDTH_RATIO = 0.35
 HEADER_SPACING_MULTIPLIER = 1.6
 FLOAT_TOLERANCE = 1e-9
+DRAWING_CACHE_SIZE = 256
+TITLE_FORM_NAME = "mathtest-title"
+
+
+@lru_cache(maxsize=64)
+def _label_width(label: str, font_name: str, font_size: float) -> float:
+    """Return the rendered width of a header label, cached per font and size."""
+
+    from reportlab.pdfbase.pdfmetrics import (  # type: ignore[import-untyped]
+        stringWidth,
+    )
+
+    return stringWidth(label, font_name, font_size)
+
+
+# Standard Courier faces advance every glyph by 600/1000 em, so anchor widths for
+# ASCII text need no metrics lookup.
+_COURIER_FONTS = frozenset(
+    {"Courier", "Courier-Bold", "Courier-Oblique", "Courier-BoldOblique"}
+)
+_COURIER_ADVANCE = 0.6
 
 
-def _normalize_param_keys(params: Mapping[str, Any] | None) -> dict[str, Any]:
-    """Return ``params`` with CLI-friendly keys normalized to snake_case."""
+def _text_width(value: str, font_name: str, font_size: float) -> float:
+    """Return the advance width of ``value``, short-circuiting Courier."""
 
-    normalized: dict[str, Any] = {}
-    for key, value in (params or {}).items():
-        normalized[key.replace("-", "_")] = value
-    return normalized
+    if font_name in _COURIER_FONTS and value.isascii():
+        return len(value) * font_size * _COURIER_ADVANCE
+
+    from reportlab.pdfbase.pdfmetrics import (  # type: ignore[import-untyped]
+        stringWidth,
+    )
+
+    return stringWidth(value, font_name, font_size)
+
+
+@lru_cache(maxsize=16)
+def _resolve_font(font_family: str) -> str:
+    """Return the ReportLab font svglib would select for ``font_family``."""
+
+    from svglib.svglib import (  # type: ignore[import-untyped]
+        Svg2RlgAttributeConverter,
+    )
 
+    return Svg2RlgAttributeConverter().convertFontFamily(font_family)
 
-@dataclass
+
+@dataclass(slots=True)
+class _VerticalProblem:
+    """Stacked-operand problem drawn directly onto the canvas.
+
+    Coordinates are in drawing space (points, origin bottom-left) so the
+    generator can place it exactly like a svglib :class:`Drawing`.
+    """
+
+    width: float
+    height: float
+    font_name: str
+    font_size: float
+    text_runs: tuple[tuple[float, float, str], ...]
+    rule: tuple[float, float, float, float]
+    rule_width: float
+
+    def draw(self, canvas: Canvas) -> None:
+        """Render the operands and answer rule onto ``canvas``."""
+
+        text = canvas.beginText()
+        text.setFont(self.font_name, self.font_size)
+        for x, y, value in self.text_runs:
+            text.setTextOrigin(x, y)
+            text.textOut(value)
+        canvas.drawText(text)
+        canvas.setLineWidth(self.rule_width)
+        canvas.line(*self.rule)
+
+
+def _parse_vertical_problem(svg: str) -> _VerticalProblem | None:
+    """Return a native renderer for plugin stacked-operand SVGs, if ``svg`` is one.
+
+    Mirrors svglib's conversion: ``px`` lengths become points (x0.75) and the
+    viewBox is scaled onto the declared width with the y-axis flipped.
+    """
+
+    match = VERTICAL_SVG_PATTERN.fullmatch(svg)
+    if match is None:
+        return None
+
+    view_width = float(match["width"])
+    width = view_width * 0.75
+    height = float(match["height"]) * 0.75
+    if width <= 0 or height <= 0:
+        return None
+
+    view_scale = width / view_width
+    font_name = _resolve_font(match["font_family"])
+    font_size = float(match["font_size"]) * 0.75 * view_scale
+    anchor_x = float(match["anchor_x"]) * view_scale
+    text_runs = tuple(
+        (
+            anchor_x - _text_width(match[f"{slot}_text"], font_name, font_size),
+            height - float(match[f"{slot}_y"]) * view_scale,
+            match[f"{slot}_text"],
+        )
+        for slot in ("top", "bottom")
+    )
+    line_y = height - float(match["line_y"]) * view_scale
+    rule = (
+        float(match["line_start_x"]) * view_scale,
+        line_y,
+        float(match["line_end_x"]) * view_scale,
+        line_y,
+    )
+    return _VerticalProblem(
+        width=width,
+        height=height,
+        font_name=font_name,
+        font_size=font_size,
+        text_runs=text_runs,
+        rule=rule,
+        rule_width=float(match["rule_width"]) * view_scale,
+    )
+
+
+@dataclass(slots=True)
 class _PreparedProblem:
     """Pre-parsed SVG metadata used during layout planning."""
 
     problem: Problem
-    drawing: Drawing
+    drawing: Drawing | _VerticalProblem
     scale: float
     scaled_height: float
     scaled_width: float
 
 
-@dataclass
+@dataclass(slots=True)
 class _Placement:
     """Drawing metadata for a problem positioned within a row."""
 
@@ -63,7 +183,7 @@ class _Placement:
     top: float
 
 
-@dataclass
+@dataclass(slots=True)
 class _RowLayout:
     """Problems that share a common top coordinate on a page."""
 
@@ -72,17 +192,100 @@ class _RowLayout:
     placements: list[_Placement]
 
 
-@dataclass
+@dataclass(slots=True)
 class _PageLayout:
     """Collection of rows scheduled to render on the same page."""
 
     rows: list[_RowLayout]
 
 
+def _justify_rows(rows: Sequence[_RowLayout], margin: float) -> None:
+    """Spread leftover vertical space on a page evenly between ``rows``."""
+
+    last_row = rows[-1]
+    extra_space = (last_row.top - last_row.height) - margin
+    if extra_space <= FLOAT_TOLERANCE:
+        return
+    if len(rows) == 1:
+        row = rows[0]
+        row.top -= extra_space
+        for placement in row.placements:
+            placement.top -= extra_space
+        return
+
+    gap_increment = extra_space / (len(rows) - 1)
+    cumulative_shift = 0.0
+    for row in rows[1:]:
+        cumulative_shift += gap_increment
+        row.top -= cumulative_shift
+        for placement in row.placements:
+            placement.top -= cumulative_shift
+
+
+@dataclass(slots=True)
+class _LayoutState:
+    """Cursor used while packing prepared problems into rows and pages."""
+
+    page_top: float
+    row_spacing: float
+    row: _RowLayout = field(init=False)
+    row_height: float = 0.0
+    column: int = 0
+    page_rows: list[_RowLayout] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self.row = _RowLayout(top=self.page_top, height=0.0, placements=[])
+
+    def _close_row(self) -> bool:
+        """Commit the open row to the current page if it holds placements."""
+
+        if not self.row.placements:
+            return False
+        self.row.height = self.row_height
+        self.page_rows.append(self.row)
+        return True
+
+    def _open_row(self, top: float) -> None:
+        self.row = _RowLayout(top=top, height=0.0, placements=[])
+        self.row_height = 0.0
+        self.column = 0
+
+    def advance_row(self) -> None:
+        """Close the open row and start the next one beneath it."""
+
+        # An empty row already sits at the cursor with no height, so it is reused.
+        if not self._close_row():
+            return
+        self._open_row(self.row.top - (self.row_height + self.row_spacing))
+
+    def start_new_page(self) -> _PageLayout | None:
+        """Close the open row and page, returning the page if it has rows."""
+
+        # With no committed rows the empty open row is still at the page top.
+        if not self._close_row() and not self.page_rows:
+            return None
+        page = _PageLayout(rows=self.page_rows)
+        self.page_rows = []
+        self._open_row(self.page_top)
+        return page
+
+
+@dataclass(frozen=True, slots=True)
+class _PageGeometry:
+    """Letter-page measurements derived once from :class:`PdfOutputParams`."""
+
+    page_width: float
+    page_height: float
+    column_width: float
+    column_offsets: tuple[float, ...]
+    title_block_height: float
+    first_row_top: float
+
+
 class PdfOutputParams(BaseModel):
     """Validated configuration passed to :class:`PdfOutputGenerator`."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     path: Path = Field(..., description="Destination PDF file path.")
     title: str = Field(
@@ -145,6 +348,13 @@ class PdfOutputParams(BaseModel):
         ge=0,
         description="Horizontal spacing between columns in inches.",
     )
+    compress: bool = Field(
+        default=True,
+        description=(
+            "Deflate page content streams to shrink the written PDF. Disable to "
+            "keep content streams human-readable when debugging layout."
+        ),
+    )
 
     @property
     def margin(self) -> float:
@@ -164,10 +374,62 @@ class PdfOutputParams(BaseModel):
 
         return self.column_spacing_inches * inch
 
+    @cached_property
+    def geometry(self) -> _PageGeometry:
+        """Return the page, column and title measurements for this configuration.
+
+        Raises:
+            ValueError: If the margins or column spacing leave no room for
+                problem columns.
+        """
+
+        page_width, page_height = letter
+        margin = self.margin
+        content_width = page_width - (2 * margin)
+        if content_width <= 0:
+            msg = "Configured margins leave no horizontal space for content"
+            raise ValueError(msg)
+
+        column_spacing = self.column_spacing
+        available_width = content_width - column_spacing * (self.columns - 1)
+        if available_width <= 0:
+            msg = "Configured column spacing leaves no room for problem columns"
+            raise ValueError(msg)
+
+        column_width = available_width / self.columns
+        column_step = column_width + column_spacing
+        title_block_height = 0.0
+        if self.title:
+            title_block_height = self.title_font_size * 1.5
+            if self.include_student_header:
+                label_font_size = max(
+                    float(self.title_font_size), MIN_HEADER_LABEL_FONT_SIZE
+                )
+                title_block_height += label_font_size * HEADER_SPACING_MULTIPLIER
+
+        return _PageGeometry(
+            page_width=page_width,
+            page_height=page_height,
+            column_width=column_width,
+            column_offsets=tuple(
+                margin + index * column_step for index in range(self.columns)
+            ),
+            title_block_height=title_block_height,
+            first_row_top=page_height - margin - title_block_height,
+        )
+
 
 class PdfOutputGenerator(OutputGenerator):
     """Render problems into a PDF document using ReportLab (MVP Phase 4)."""
 
+    def __init__(self) -> None:
+        # Parsed drawings keyed by SVG markup. Drawings are only read while
+        # rendering, so repeated problems (within or across worksheets) can share
+        # one instance instead of re-parsing identical markup.
+        self._drawing_cache: OrderedDict[str, Drawing | _VerticalProblem] = (
+            OrderedDict()
+        )
+
     def generate(self, problems: Sequence[Problem], params: Mapping[str, Any]) -> None:
         """Generate a PDF worksheet from ``problems``.
 
@@ -181,7 +443,7 @@ class PdfOutputGenerator(OutputGenerator):
         """
 
         try:
-            config = PdfOutputParams.model_validate(_normalize_param_keys(params))
+            config = PdfOutputParams.model_validate(normalize_param_keys(params))
         except ValidationError as exc:  # pragma: no cover - defensive branch
             raise ValueError("Invalid PDF output parameters") from exc
 
@@ -189,48 +451,39 @@ class PdfOutputGenerator(OutputGenerator):
             msg = "At least one problem is required to build a worksheet"
             raise ValueError(msg)
 
+        geometry = config.geometry
+        from reportlab.graphics import renderPDF  # type: ignore[import-untyped]
+        from reportlab.pdfgen.canvas import Canvas  # type: ignore[import-untyped]
+
         config.path.parent.mkdir(parents=True, exist_ok=True)
         canvas = Canvas(str(config.path), pagesize=letter)
-        canvas.setPageCompression(0)
-        width, height = letter
-        content_width = width - (2 * config.margin)
-        if content_width <= 0:
-            msg = "Configured margins leave no horizontal space for content"
-            raise ValueError(msg)
-
-        total_spacing = config.column_spacing * (config.columns - 1)
-        available_width = content_width - total_spacing
-        if available_width <= 0:
-            msg = "Configured column spacing leaves no room for problem columns"
-            raise ValueError(msg)
-
-        column_width = available_width / config.columns
-        column_offsets = [
-            config.margin + index * (column_width + config.column_spacing)
-            for index in range(config.columns)
-        ]
-        page_initial_top = self._page_initial_row_top(config, height)
+        canvas.setPageCompression(1 if config.compress else 0)
+        width = geometry.page_width
+        height = geometry.page_height
+        margin = config.margin
+        column_width = geometry.column_width
+        if config.title:
+            # The title block is identical on every worksheet page, so it is
+            # recorded once as a form XObject and stamped per page. Forms must be
+            # defined before any page content is drawn.
+            canvas.beginForm(TITLE_FORM_NAME)
+            self._draw_title(canvas, config, width, height - margin)
+            canvas.endForm()
 
         answers: list[str] = []
         prepared_problems: list[_PreparedProblem] = []
         for problem in problems:
-            drawing = svg2rlg(io.StringIO(problem.svg))
-            if drawing.width is None or drawing.height is None:
-                msg = "Problem SVG must provide explicit width and height"
-                raise ValueError(msg)
-            if drawing.width <= 0 or drawing.height <= 0:
-                msg = "Problem SVG dimensions must be positive"
-                raise ValueError(msg)
-
-            scale = column_width / float(drawing.width)
-            scaled_height = float(drawing.height) * scale
+            drawing = self._load_drawing(problem.svg)
+            # ``_load_drawing`` guarantees positive float dimensions.
+            drawing_width = drawing.width
+            scale = column_width / drawing_width
             prepared_problems.append(
                 _PreparedProblem(
                     problem=problem,
                     drawing=drawing,
                     scale=scale,
-                    scaled_height=scaled_height,
-                    scaled_width=drawing.width * scale,
+                    scaled_height=drawing.height * scale,
+                    scaled_width=drawing_width * scale,
                 )
             )
 
@@ -240,112 +493,15 @@ class PdfOutputGenerator(OutputGenerator):
                 raise ValueError(msg)
             answers.append(str(answer))
 
-        pages: list[_PageLayout] = []
-        current_page_rows: list[_RowLayout] = []
-        current_row_top = page_initial_top
-        current_row = _RowLayout(
-            top=current_row_top, height=0.0, placements=[]
-        )
-        current_row_height = 0.0
-        current_column = 0
-
-        def advance_row() -> None:
-            nonlocal current_row_top, current_row_height, current_row, current_column, current_page_rows
-            if current_row.placements:
-                row_height = current_row_height
-                current_row.height = row_height
-                current_page_rows.append(current_row)
-                current_row_top -= row_height + config.problem_spacing
-            current_row = _RowLayout(
-                top=current_row_top, height=0.0, placements=[]
-            )
-            current_row_height = 0.0
-            current_column = 0
-
-        def start_new_page() -> None:
-            nonlocal current_row_top, current_row_height, current_row, current_column, current_page_rows, pages
-            if current_row.placements:
-                current_row.height = current_row_height
-                current_page_rows.append(current_row)
-            if current_page_rows:
-                pages.append(_PageLayout(rows=current_page_rows))
-            current_page_rows = []
-            current_row_top = page_initial_top
-            current_row = _RowLayout(
-                top=current_row_top, height=0.0, placements=[]
-            )
-            current_row_height = 0.0
-            current_column = 0
-
-        for prepared in prepared_problems:
-            scaled_height = prepared.scaled_height
-
-            if current_column >= config.columns:
-                advance_row()
-
-            if current_row_top - scaled_height < config.margin:
-                if current_row_height > 0 and current_column > 0:
-                    advance_row()
-
-            if current_row_top - scaled_height < config.margin:
-                start_new_page()
-                if current_row_top - scaled_height < config.margin:
-                    msg = "Problem geometry exceeds available page height"
-                    raise ValueError(msg)
-
-            remaining_width = column_width - prepared.scaled_width
-            if abs(remaining_width) <= FLOAT_TOLERANCE:
-                remaining_width = 0.0
-
-            x_offset = column_offsets[current_column] + max(0.0, remaining_width)
-            placement = _Placement(
-                prepared=prepared,
-                column_index=current_column,
-                x_offset=x_offset,
-                top=current_row_top,
-            )
-            current_row.placements.append(placement)
-            current_row_height = max(current_row_height, scaled_height)
-            current_row.height = current_row_height
-            current_column += 1
-
-        if current_row.placements:
-            current_row.height = current_row_height
-            current_page_rows.append(current_row)
-        if current_page_rows:
-            pages.append(_PageLayout(rows=current_page_rows))
-
-        for page in pages:
-            rows = page.rows
-            if not rows:
-                continue
-            last_row = rows[-1]
-            last_bottom = last_row.top - last_row.height
-            extra_space = last_bottom - config.margin
-            if extra_space > FLOAT_TOLERANCE:
-                if len(rows) == 1:
-                    shift = extra_space
-                    row = rows[0]
-                    row.top -= shift
-                    for placement in row.placements:
-                        placement.top -= shift
-                else:
-                    gap_increment = extra_space / (len(rows) - 1)
-                    cumulative_shift = 0.0
-                    for row in rows[1:]:
-                        cumulative_shift += gap_increment
-                        row.top -= cumulative_shift
-                        for placement in row.placements:
-                            placement.top -= cumulative_shift
-
-        for page_index, page in enumerate(pages):
+        last_page: _PageLayout | None = None
+        for page_index, page in enumerate(
+            self._iter_pages(prepared_problems, config)
+        ):
+            _justify_rows(page.rows, margin)
             if page_index > 0:
                 canvas.showPage()
-            current_header_top = height - config.margin
             if config.title:
-                current_header_top = self._draw_title(
-                    canvas, config, width, current_header_top
-                )
+                canvas.doForm(TITLE_FORM_NAME)
             for row in page.rows:
                 for placement in row.placements:
                     drawing = placement.prepared.drawing
@@ -355,40 +511,120 @@ class PdfOutputGenerator(OutputGenerator):
                     y_offset = placement.top - scaled_height
 
                     canvas.saveState()
-                    canvas.translate(x_offset, y_offset)
-                    canvas.scale(scale, scale)
-                    renderPDF.draw(drawing, canvas, 0, 0)
+                    # One ``cm`` operator for the combined translate + scale.
+                    canvas.transform(scale, 0, 0, scale, x_offset, y_offset)
+                    if isinstance(drawing, _VerticalProblem):
+                        drawing.draw(canvas)
+                    else:
+                        renderPDF.draw(drawing, canvas, 0, 0)
                     canvas.restoreState()
+            last_page = page
 
-        if pages and pages[-1].rows:
-            last_row = pages[-1].rows[-1]
+        if last_page is not None:
+            last_row = last_page.rows[-1]
             current_y = last_row.top - last_row.height
         else:
-            current_y = page_initial_top
+            current_y = geometry.first_row_top
 
         if config.include_answers and answers:
             self._draw_answers(canvas, config, height, current_y, answers)
 
         canvas.save()
 
-    def _page_initial_row_top(
-        self, config: PdfOutputParams, page_height: float
-    ) -> float:
-        """Return the top coordinate for the first row on a page."""
+    def _iter_pages(
+        self, prepared_problems: Sequence[_PreparedProblem], config: PdfOutputParams
+    ) -> Iterator[_PageLayout]:
+        """Pack ``prepared_problems`` into rows, yielding each page once it is full.
 
-        top = page_height - config.margin
-        if config.title:
-            top -= self._title_block_height(config)
-        return top
+        Pages are produced lazily so the caller can justify and draw one page at a
+        time instead of holding the whole worksheet layout.
 
-    def _title_block_height(self, config: PdfOutputParams) -> float:
-        """Compute the vertical space consumed by the title and header."""
+        Raises:
+            ValueError: If a problem is taller than the space below the title.
+        """
 
-        height = config.title_font_size * 1.5
-        if not config.include_student_header:
-            return height
-        label_font_size = max(float(config.title_font_size), MIN_HEADER_LABEL_FONT_SIZE)
-        return height + (label_font_size * HEADER_SPACING_MULTIPLIER)
+        # Bind the derived measurements once; the loop reads them per problem.
+        geometry = config.geometry
+        margin = config.margin
+        columns = config.columns
+        column_width = geometry.column_width
+        column_offsets = geometry.column_offsets
+
+        state = _LayoutState(
+            page_top=geometry.first_row_top, row_spacing=config.problem_spacing
+        )
+        for prepared in prepared_problems:
+            scaled_height = prepared.scaled_height
+
+            if state.column >= columns:
+                state.advance_row()
+
+            # Only re-test the fit after a row or page break actually moved the
+            # cursor; problems that fit the current row pay for a single check.
+            if state.row.top - scaled_height < margin:
+                if state.row_height > 0 and state.column > 0:
+                    state.advance_row()
+                if state.row.top - scaled_height < margin:
+                    page = state.start_new_page()
+                    if page is not None:
+                        yield page
+                    if state.row.top - scaled_height < margin:
+                        msg = "Problem geometry exceeds available page height"
+                        raise ValueError(msg)
+
+            remaining_width = column_width - prepared.scaled_width
+            if abs(remaining_width) <= FLOAT_TOLERANCE:
+                remaining_width = 0.0
+
+            x_offset = column_offsets[state.column] + max(0.0, remaining_width)
+            state.row.placements.append(
+                _Placement(
+                    prepared=prepared,
+                    column_index=state.column,
+                    x_offset=x_offset,
+                    top=state.row.top,
+                )
+            )
+            state.row_height = max(state.row_height, scaled_height)
+            state.column += 1
+
+        page = state.start_new_page()
+        if page is not None:
+            yield page
+
+    def _load_drawing(self, svg: str) -> Drawing | _VerticalProblem:
+        """Return the validated drawing for ``svg``, parsing it at most once.
+
+        Worksheets built from narrow operand ranges repeat identical problems, so
+        drawings are memoized in a bounded LRU keyed by the SVG markup. The
+        stacked-operand plugin layout skips svglib entirely.
+        """
+
+        cache = self._drawing_cache
+        drawing = cache.get(svg)
+        if drawing is not None:
+            cache.move_to_end(svg)
+            return drawing
+
+        drawing = _parse_vertical_problem(svg)
+        if drawing is None:
+            from svglib.svglib import svg2rlg  # type: ignore[import-untyped]
+
+            drawing = svg2rlg(io.StringIO(svg))
+            width, height = drawing.width, drawing.height
+            if width is None or height is None:
+                msg = "Problem SVG must provide explicit width and height"
+                raise ValueError(msg)
+            if width <= 0 or height <= 0:
+                msg = "Problem SVG dimensions must be positive"
+                raise ValueError(msg)
+            drawing.width = float(width)
+            drawing.height = float(height)
+
+        cache[svg] = drawing
+        if len(cache) > DRAWING_CACHE_SIZE:
+            cache.popitem(last=False)
+        return drawing
 
     def _draw_title(
         self,
@@ -396,15 +632,15 @@ class PdfOutputGenerator(OutputGenerator):
         config: PdfOutputParams,
         page_width: float,
         current_y: float,
-    ) -> float:
-        """Render the document title and return the updated cursor position."""
+    ) -> None:
+        """Render the document title and the optional student header."""
 
         canvas.setFont(config.body_font, config.title_font_size)
         canvas.drawCentredString(page_width / 2, current_y, config.title)
         next_y = current_y - (config.title_font_size * 1.5)
 
         if not config.include_student_header:
-            return current_y - self._title_block_height(config)
+            return
 
         label_font_size = max(float(config.title_font_size), MIN_HEADER_LABEL_FONT_SIZE)
         canvas.setFont(config.body_font, label_font_size)
@@ -425,7 +661,7 @@ class PdfOutputGenerator(OutputGenerator):
         # ``config.body_font``, and ``canvas``.
         def draw_field(label: str, field_x: float, field_width: float) -> None:
             canvas.drawString(field_x, next_y, label)
-            label_width = canvas.stringWidth(label, config.body_font, label_font_size)
+            label_width = _label_width(label, config.body_font, label_font_size)
             line_start = field_x + label_width + label_padding
             line_end = field_x + field_width
             line_start = min(line_start, line_end)
@@ -435,10 +671,6 @@ class PdfOutputGenerator(OutputGenerator):
         draw_field("Name:", name_x, name_field_width)
         draw_field("Date:", date_x, date_field_width)
 
-        next_y -= label_font_size * HEADER_SPACING_MULTIPLIER
-
-        return current_y - self._title_block_height(config)
-
     def _draw_answers(
         self,
         canvas: Canvas,
@@ -459,13 +691,24 @@ class PdfOutputGenerator(OutputGenerator):
         canvas.drawString(config.margin, current_y, config.answer_title)
         current_y -= config.title_font_size * 1.2
 
-        canvas.setFont(config.body_font, config.answer_font_size)
         line_height = config.answer_font_size * 1.4
-        for index, answer in enumerate(answers, start=1):
+
+        # One text object per page keeps the font and leading in a single BT/ET
+        # block instead of re-emitting them for every answer.
+        def begin_text(top: float) -> PDFTextObject:
+            text = canvas.beginText(config.margin, top)
+            text.setFont(config.body_font, config.answer_font_size, line_height)
+            return text
+
+        lines = [f"{index}. {answer}" for index, answer in enumerate(answers, start=1)]
+        text = begin_text(current_y)
+        for line in lines:
             if current_y - line_height < config.margin:
+                canvas.drawText(text)
                 canvas.showPage()
                 current_y = page_height - config.margin
-                canvas.setFont(config.body_font, config.answer_font_size)
-            canvas.drawString(config.margin, current_y, f"{index}. {answer}")
+                text = begin_text(current_y)
+            text.textLine(line)
             current_y -= line_height
+        canvas.drawText(text)
 
@@ -5,137 +5,10 @@ from __future__ import annotations
 import random
 from typing import Any, Mapping
 
-import svgwrite  # type: ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 from ..interface import ParameterDefinition, Problem
-
-
-_VERTICAL_FONT_SIZE = 34
-_VERTICAL_HEIGHT_MULTIPLIERS = [0.4, 1.0, 1.25, 0.35, 1.125]
-
-
-def _normalize_param_keys(params: Mapping[str, Any] | None) -> dict[str, Any]:
-    """Map external configuration keys to Pydantic field names.
-
-    Args:
-        params: Raw configuration dictionary that may contain hyphenated keys
-            from CLI flags or YAML settings.
-
-    Returns:
-        A dictionary with hyphenated keys converted to snake_case so they align
-        with the ``_AdditionParams`` model definition.
-    """
-
-    normalized: dict[str, Any] = {}
-    for key, value in (params or {}).items():
-        normalized[key.replace("-", "_")] = value
-    return normalized
-
-
-def _format_operand(value: int) -> str:
-    """Format an operand for vertical rendering.
-
-    Args:
-        value: The integer operand to render.
-
-    Returns:
-        The operand rendered as a string with negatives wrapped in parentheses
-        to match grade-school formatting expectations.
-    """
-
-    return f"({value})" if value < 0 else str(value)
-
-
-def _render_vertical_problem(
-    top: int,
-    bottom: int,
-    operator: str,
-    minimum_digit_chars: int | None = None,
-) -> str:
-    """Create a vertically stacked arithmetic SVG illustration.
-
-    Args:
-        top: The top operand shown in the vertical layout.
-        bottom: The bottom operand shown beneath the operator.
-        operator: The arithmetic operator symbol to display between operands.
-        minimum_digit_chars: Optional lower bound for the operand character
-            count when measuring layout width. This keeps rendered problems
-            consistent across varying operand lengths so downstream scaling
-            does not change font sizes.
-
-    Returns:
-        An SVG string matching the dimensions and typography outlined in
-        ``SDD §3.2.3`` so that addition and subtraction plugins remain visually
-        consistent.
-    """
-
-    char_width = _VERTICAL_FONT_SIZE * 0.6
-    margin = _VERTICAL_FONT_SIZE * 0.45
-    top_padding = _VERTICAL_FONT_SIZE * 0.4
-    baseline_gap = _VERTICAL_FONT_SIZE * 1.25
-    underline_offset = _VERTICAL_FONT_SIZE * 0.35
-    # Provide extra writing room beneath the underline for student answers.
-    bottom_padding = _VERTICAL_FONT_SIZE * 1.125
-
-    top_y = top_padding + _VERTICAL_FONT_SIZE
-    bottom_y = top_y + baseline_gap
-    line_y = bottom_y + underline_offset
-    height = line_y + bottom_padding
-
-    top_text = _format_operand(top)
-    bottom_operand = _format_operand(bottom)
-    operator_prefix_chars = len(f"{operator} ")
-
-    min_char_target = minimum_digit_chars or 0
-    max_operand_chars = max(len(top_text), len(bottom_operand), min_char_target)
-    digit_span = max_operand_chars * char_width
-    left_padding = margin + operator_prefix_chars * char_width
-    digit_anchor_x = left_padding + digit_span
-    underline_start_x = digit_anchor_x - (
-        (len(bottom_operand) + operator_prefix_chars) * char_width
-    )
-    underline_end_x = digit_anchor_x
-    width = digit_anchor_x + margin
-
-    def _round(value: float) -> float:
-        return round(value, 4)
-
-    drawing = svgwrite.Drawing(
-        size=(f"{_round(width):.2f}px", f"{_round(height):.2f}px"),
-    )
-    drawing.viewbox(0, 0, _round(width), _round(height))
-
-    text_style = {
-        "font_size": f"{_VERTICAL_FONT_SIZE}px",
-        "font_family": "FiraMono, monospace",
-        "text_anchor": "end",
-    }
-
-    drawing.add(
-        drawing.text(
-            top_text,
-            insert=(_round(digit_anchor_x), _round(top_y)),
-            **text_style,
-        )
-    )
-    drawing.add(
-        drawing.text(
-            f"{operator} {bottom_operand}",
-            insert=(_round(digit_anchor_x), _round(bottom_y)),
-            **text_style,
-        )
-    )
-    drawing.add(
-        drawing.line(
-            start=(_round(underline_start_x), _round(line_y)),
-            end=(_round(underline_end_x), _round(line_y)),
-            stroke="#000000",
-            stroke_width=2,
-        )
-    )
-
-    return drawing.tostring()
+from .common import normalize_param_keys, operand_len, render_vertical_problem_cached
 
 
 class _AdditionParams(BaseModel):
@@ -196,7 +69,8 @@ class _AdditionData(BaseModel):
             msg = "operator must be '+' for addition problems"
             raise ValueError(msg)
 
-        computed = sum(self.operands)
+        top, bottom = self.operands
+        computed = top + bottom
         if self.answer is None:
             self.answer = computed
         elif self.answer != computed:
@@ -205,6 +79,47 @@ class _AdditionData(BaseModel):
         return self
 
 
+_TRUSTED_DATA_KEYS = frozenset({"operands", "operator", "answer", "min_digit_chars"})
+
+
+def _trusted_payload(data: Mapping[str, Any]) -> dict[str, Any] | None:
+    """Return a copy of ``data`` when it exactly matches plugin-emitted payloads.
+
+    Args:
+        data: Serialized problem data passed to
+            :meth:`AdditionPlugin.generate_from_data`.
+
+    Returns:
+        The payload ``_AdditionData.model_dump()`` would produce when ``data``
+        has the exact key set, plain ``int`` values, and a consistent answer;
+        otherwise ``None`` so the caller falls back to full validation.
+    """
+
+    if data.keys() != _TRUSTED_DATA_KEYS:
+        return None
+    operands = data["operands"]
+    answer = data["answer"]
+    min_digit_chars = data["min_digit_chars"]
+    if (
+        type(operands) is not list
+        or len(operands) != 2
+        or type(operands[0]) is not int
+        or type(operands[1]) is not int
+        or data["operator"] != "+"
+        or type(answer) is not int
+        or answer != operands[0] + operands[1]
+        or type(min_digit_chars) is not int
+        or min_digit_chars < 1
+    ):
+        return None
+    return {
+        "operands": [operands[0], operands[1]],
+        "operator": "+",
+        "answer": answer,
+        "min_digit_chars": min_digit_chars,
+    }
+
+
 class AdditionPlugin:
     """Generate vertically stacked addition problems (SDD §3.2.3, MVP Phase 2)."""
 
@@ -222,7 +137,7 @@ class AdditionPlugin:
         """
 
         try:
-            self._config = _AdditionParams.model_validate(_normalize_param_keys(params))
+            self._config = _AdditionParams.model_validate(normalize_param_keys(params))
         except ValidationError as exc:  # pragma: no cover - defensive rewrap
             raise ValueError("Invalid addition plugin parameters") from exc
 
@@ -230,8 +145,8 @@ class AdditionPlugin:
         if self._config.random_seed is not None:
             self._random.seed(self._config.random_seed)
         self._min_digit_chars = max(
-            len(_format_operand(self._config.min_operand)),
-            len(_format_operand(self._config.max_operand)),
+            operand_len(self._config.min_operand),
+            operand_len(self._config.max_operand),
         )
 
     @property
@@ -286,11 +201,11 @@ class AdditionPlugin:
         )
         answer = augend + addend
 
-        svg = _render_vertical_problem(
+        svg = render_vertical_problem_cached(
             augend,
             addend,
             "+",
-            minimum_digit_chars=self._min_digit_chars,
+            self._min_digit_chars,
         )
         data = {
             "operands": [augend, addend],
@@ -298,7 +213,9 @@ class AdditionPlugin:
             "answer": answer,
             "min_digit_chars": self._min_digit_chars,
         }
-        return Problem(svg=svg, data=data)
+        # The payload is built from validated config and always carries an
+        # answer, so ``Problem`` validation would only re-check our own output.
+        return Problem.model_construct(svg=svg, data=data)
 
     @classmethod
     def generate_from_data(cls, data: Mapping[str, Any]) -> Problem:
@@ -316,23 +233,25 @@ class AdditionPlugin:
             ValueError: If ``data`` cannot be validated by ``_AdditionData``.
         """
 
-        try:
-            validated = _AdditionData.model_validate(dict(data))
-        except ValidationError as exc:  # pragma: no cover - defensive rewrap
-            raise ValueError("Invalid addition problem data") from exc
-
-        top, bottom = validated.operands
-        min_digit_chars = validated.min_digit_chars
+        # Payloads round-tripped from ``generate_problem`` are already valid, so
+        # only unfamiliar shapes pay for Pydantic validation.
+        payload = _trusted_payload(data)
+        if payload is None:
+            try:
+                validated = _AdditionData.model_validate(data)
+            except ValidationError as exc:  # pragma: no cover - defensive rewrap
+                raise ValueError("Invalid addition problem data") from exc
+            payload = validated.model_dump()
+
+        top, bottom = payload["operands"]
+        min_digit_chars = payload["min_digit_chars"]
         if min_digit_chars is None:
-            min_digit_chars = max(
-                len(_format_operand(value)) for value in validated.operands
-            )
+            min_digit_chars = max(operand_len(value) for value in payload["operands"])
 
-        svg = _render_vertical_problem(
+        svg = render_vertical_problem_cached(
             top,
             bottom,
             "+",
-            minimum_digit_chars=min_digit_chars,
+            min_digit_chars,
         )
-        payload = validated.model_dump()
-        return Problem(svg=svg, data=payload)
+        return Problem.model_construct(svg=svg, data=payload)
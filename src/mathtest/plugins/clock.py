@@ -2,26 +2,57 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 import math
 import random
 from typing import Any, Iterable, Mapping
 
-import svgwrite  # type: ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 from ..interface import ParameterDefinition, Problem
+from .common import normalize_param_keys
 
 
 _ALLOWED_MINUTE_INTERVALS = {5, 15, 30, 60}
 
-
-def _normalize_param_keys(params: Mapping[str, Any] | None) -> dict[str, Any]:
-    """Convert hyphenated configuration keys to snake_case names."""
-
-    normalized: dict[str, Any] = {}
-    for key, value in (params or {}).items():
-        normalized[key.replace("-", "_")] = value
-    return normalized
+_CLOCK_WIDTH = 260
+_CLOCK_HEIGHT = 380
+_CENTER_X = _CLOCK_WIDTH / 2
+_CENTER_Y = 160.0
+_OUTER_RADIUS = 110.0
+_BEZEL_RADIUS = _OUTER_RADIUS + 10.0
+_NUMBER_RADIUS = _OUTER_RADIUS - 16.0
+_TICK_OUTER_RADIUS = _NUMBER_RADIUS - 20.0
+_TICK_INNER_RADIUS = _TICK_OUTER_RADIUS - 12.0
+_HOUR_HAND_LENGTH = 72.0
+_MINUTE_HAND_LENGTH = 104.0
+
+# Element templates using svgwrite's sorted attribute order. Coordinates carry one
+# decimal place, which is already sub-pixel on a 260px face.
+_CLOCK_SVG_HEADER = (
+    '<svg baseProfile="full" height="{height}px" version="1.1" '
+    'viewBox="0,0,{width},{height}" width="{width}px" '
+    'xmlns="http://www.w3.org/2000/svg" '
+    'xmlns:ev="http://www.w3.org/2001/xml-events" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink"><defs />'
+)
+_CIRCLE_TEMPLATE = (
+    '<circle cx="{cx:.1f}" cy="{cy:.1f}" fill="{fill}" r="{r:.1f}" '
+    'stroke="#000000" stroke-width="{stroke_width}" />'
+)
+_CENTER_DOT_TEMPLATE = '<circle cx="{cx:.1f}" cy="{cy:.1f}" fill="#000000" r="4" />'
+_LABEL_TEMPLATE = (
+    '<text font-family="FiraSans, sans-serif" font-size="{font_size}px" '
+    'text-anchor="middle" x="{x:.1f}" y="{y:.1f}">{label}</text>'
+)
+_ANSWER_LABEL_TEMPLATE = (
+    '<text font-family="FiraSans, sans-serif" font-size="24px" x="{x:.1f}" '
+    'y="{y:.1f}">Answer:</text>'
+)
+_LINE_TEMPLATE = (
+    '<line stroke="#000000" stroke-width="{stroke_width}" x1="{x1:.1f}" '
+    'x2="{x2:.1f}" y1="{y1:.1f}" y2="{y2:.1f}" />'
+)
 
 
 def _format_answer(hour: int, minute: int, is_24_hour: bool) -> str:
@@ -161,7 +192,7 @@ def _polar_point(
     radians = math.radians(angle_degrees - 90.0)
     x = center_x + radius * math.cos(radians)
     y = center_y + radius * math.sin(radians)
-    return (round(x, 4), round(y, 4))
+    return (x, y)
 
 
 def _clock_labels(is_24_hour: bool) -> Iterable[str]:
@@ -174,125 +205,109 @@ def _clock_labels(is_24_hour: bool) -> Iterable[str]:
     return labels
 
 
-def _render_clock_face(data: _ClockData) -> str:
-    """Render an analog clock SVG honoring ``data``."""
+@lru_cache(maxsize=2)
+def _render_dial(is_24_hour: bool) -> str:
+    """Return the SVG prologue shared by every clock with the given dial.
+
+    The bezel, face, hour labels, and tick marks do not depend on the time being
+    shown, so they are rendered once per dial type and reused for every problem.
+    """
 
-    width = 260
-    height = 380
-    center_x = width / 2
-    center_y = 160.0
-    outer_radius = 110.0
-    bezel_radius = outer_radius + 10.0
-    number_radius = outer_radius - 16.0
-    tick_outer_radius = number_radius - 20.0
-    tick_inner_radius = tick_outer_radius - 12.0
-    hour_hand_length = 72.0
-    minute_hand_length = 104.0
-
-    drawing = svgwrite.Drawing(size=(f"{width}px", f"{height}px"))
-    drawing.viewbox(0, 0, width, height)
-
-    drawing.add(
-        drawing.circle(
-            center=(center_x, center_y),
-            r=bezel_radius,
+    parts = [
+        _CLOCK_SVG_HEADER.format(width=_CLOCK_WIDTH, height=_CLOCK_HEIGHT),
+        _CIRCLE_TEMPLATE.format(
+            cx=_CENTER_X,
+            cy=_CENTER_Y,
             fill="#F0F0F0",
-            stroke="#000000",
+            r=_BEZEL_RADIUS,
             stroke_width=4,
-        )
-    )
-    drawing.add(
-        drawing.circle(
-            center=(center_x, center_y),
-            r=outer_radius,
+        ),
+        _CIRCLE_TEMPLATE.format(
+            cx=_CENTER_X,
+            cy=_CENTER_Y,
             fill="#FFFFFF",
-            stroke="#000000",
+            r=_OUTER_RADIUS,
             stroke_width=2,
-        )
-    )
+        ),
+    ]
 
-    labels = list(_clock_labels(data.is_24_hour))
+    labels = list(_clock_labels(is_24_hour))
     step = 360.0 / len(labels)
-    number_font_size = 24 if data.is_24_hour else 32
+    number_font_size = 24 if is_24_hour else 32
 
     for index, label in enumerate(labels):
         angle = index * step
-        text_x, text_y = _polar_point(angle, number_radius, center_x, center_y)
-        drawing.add(
-            drawing.text(
-                label,
-                insert=(text_x, text_y + number_font_size / 3.0),
-                text_anchor="middle",
-                font_size=f"{number_font_size}px",
-                font_family="FiraSans, sans-serif",
+        text_x, text_y = _polar_point(angle, _NUMBER_RADIUS, _CENTER_X, _CENTER_Y)
+        parts.append(
+            _LABEL_TEMPLATE.format(
+                font_size=number_font_size,
+                x=text_x,
+                y=text_y + number_font_size / 3.0,
+                label=label,
             )
         )
 
-        tick_start = _polar_point(angle, tick_inner_radius, center_x, center_y)
-        tick_end = _polar_point(angle, tick_outer_radius, center_x, center_y)
-        drawing.add(
-            drawing.line(
-                start=tick_start,
-                end=tick_end,
-                stroke="#000000",
-                stroke_width=2,
+        tick_x1, tick_y1 = _polar_point(
+            angle, _TICK_INNER_RADIUS, _CENTER_X, _CENTER_Y
+        )
+        tick_x2, tick_y2 = _polar_point(
+            angle, _TICK_OUTER_RADIUS, _CENTER_X, _CENTER_Y
+        )
+        parts.append(
+            _LINE_TEMPLATE.format(
+                stroke_width=2, x1=tick_x1, x2=tick_x2, y1=tick_y1, y2=tick_y2
             )
         )
 
-    hour_end = _polar_point(
-        data.hour_hand_angle, hour_hand_length, center_x, center_y
-    )
-    minute_end = _polar_point(
-        data.minute_hand_angle, minute_hand_length, center_x, center_y
-    )
+    return "".join(parts)
 
-    drawing.add(
-        drawing.line(
-            start=(center_x, center_y),
-            end=hour_end,
-            stroke="#000000",
-            stroke_width=5,
-        )
-    )
-    drawing.add(
-        drawing.line(
-            start=(center_x, center_y),
-            end=minute_end,
-            stroke="#000000",
-            stroke_width=3,
-        )
-    )
 
-    drawing.add(
-        drawing.circle(
-            center=(center_x, center_y),
-            r=4,
-            fill="#000000",
+def _render_clock_footer() -> str:
+    """Return the center dot, answer prompt, and closing tag of a clock SVG."""
+
+    answer_line_y = _CLOCK_HEIGHT
+    answer_label_x = _CLOCK_WIDTH * 0.12
+    return "".join(
+        (
+            _CENTER_DOT_TEMPLATE.format(cx=_CENTER_X, cy=_CENTER_Y),
+            _ANSWER_LABEL_TEMPLATE.format(x=answer_label_x, y=answer_line_y - 14),
+            _LINE_TEMPLATE.format(
+                stroke_width=3,
+                x1=answer_label_x + 90.0,
+                x2=_CLOCK_WIDTH * 0.88,
+                y1=answer_line_y,
+                y2=answer_line_y,
+            ),
+            "</svg>",
         )
     )
 
-    answer_line_y = height
-    answer_label_x = width * 0.12
-    answer_line_start = (answer_label_x + 90.0, answer_line_y)
-    answer_line_end = (width * 0.88, answer_line_y)
-    drawing.add(
-        drawing.text(
-            "Answer:",
-            insert=(answer_label_x, answer_line_y - 14),
-            font_size="24px",
-            font_family="FiraSans, sans-serif",
-        )
+
+_CLOCK_FOOTER = _render_clock_footer()
+
+
+def _render_clock_face(data: _ClockData) -> str:
+    """Render an analog clock SVG honoring ``data``."""
+
+    hour_x, hour_y = _polar_point(
+        data.hour_hand_angle, _HOUR_HAND_LENGTH, _CENTER_X, _CENTER_Y
     )
-    drawing.add(
-        drawing.line(
-            start=answer_line_start,
-            end=answer_line_end,
-            stroke="#000000",
-            stroke_width=3,
-        )
+    minute_x, minute_y = _polar_point(
+        data.minute_hand_angle, _MINUTE_HAND_LENGTH, _CENTER_X, _CENTER_Y
     )
 
-    return drawing.tostring()
+    return "".join(
+        (
+            _render_dial(data.is_24_hour),
+            _LINE_TEMPLATE.format(
+                stroke_width=5, x1=_CENTER_X, x2=hour_x, y1=_CENTER_Y, y2=hour_y
+            ),
+            _LINE_TEMPLATE.format(
+                stroke_width=3, x1=_CENTER_X, x2=minute_x, y1=_CENTER_Y, y2=minute_y
+            ),
+            _CLOCK_FOOTER,
+        )
+    )
 
 
 class ClockPlugin:
@@ -300,7 +315,7 @@ class ClockPlugin:
 
     def __init__(self, params: Mapping[str, Any] | None = None) -> None:
         try:
-            self._config = _ClockParams.model_validate(_normalize_param_keys(params))
+            self._config = _ClockParams.model_validate(normalize_param_keys(params))
         except ValidationError as exc:  # pragma: no cover - defensive rewrap
             raise ValueError("Invalid clock plugin parameters") from exc
 
@@ -369,28 +384,43 @@ class ClockPlugin:
             accurate=self._config.accurate_hour,
         )
         minute_angle = _minute_hand_angle(minute)
-
-        payload = _ClockData.model_validate(
-            {
-                "hour": hour,
-                "minute": minute,
-                "minute_interval": self._config.minute_interval,
-                "accurate_hour": self._config.accurate_hour,
-                "is_24_hour": self._config.is_24_hour,
-                "hour_hand_angle": hour_angle,
-                "minute_hand_angle": minute_angle,
-            }
+        minute_interval = self._config.minute_interval
+        accurate_hour = self._config.accurate_hour
+        is_24_hour = self._config.is_24_hour
+        answer = _format_answer(hour, minute, is_24_hour)
+
+        # Every field is derived from validated config, so the payload validator
+        # would only recompute the same answer and angles.
+        payload = _ClockData.model_construct(
+            hour=hour,
+            minute=minute,
+            minute_interval=minute_interval,
+            accurate_hour=accurate_hour,
+            is_24_hour=is_24_hour,
+            answer=answer,
+            hour_hand_angle=hour_angle,
+            minute_hand_angle=minute_angle,
         )
+        data = {
+            "hour": hour,
+            "minute": minute,
+            "minute_interval": minute_interval,
+            "accurate_hour": accurate_hour,
+            "is_24_hour": is_24_hour,
+            "answer": answer,
+            "hour_hand_angle": hour_angle,
+            "minute_hand_angle": minute_angle,
+        }
 
         svg = _render_clock_face(payload)
-        return Problem(svg=svg, data=payload.model_dump())
+        return Problem.model_construct(svg=svg, data=data)
 
     @classmethod
     def generate_from_data(cls, data: Mapping[str, Any]) -> Problem:
         """Recreate a clock problem deterministically from serialized data."""
 
         try:
-            payload = _ClockData.model_validate(dict(data))
+            payload = _ClockData.model_validate(data)
         except ValidationError as exc:  # pragma: no cover - defensive rewrap
             raise ValueError("Invalid clock problem data") from exc
 
@@ -0,0 +1,211 @@
+"""Helpers shared by the built-in plugins and the PDF writer (SDD §3.2.3).
+
+The stacked-operand layout used by the addition, subtraction, multiplication, and
+division plugins lives here together with the pattern the PDF writer uses to
+recognize that markup, so the two cannot drift apart.
+"""
+
+from functools import lru_cache
+import re
+from string import Formatter
+from typing import Any, Mapping
+
+VERTICAL_FONT_SIZE = 34
+VERTICAL_FONT_FAMILY = "FiraMono, monospace"
+VERTICAL_RULE_WIDTH = 2
+# Vertical bands in font-size units: top padding, first text line, baseline gap,
+# underline offset, and the writing room beneath the underline.
+VERTICAL_HEIGHT_MULTIPLIERS = (0.4, 1.0, 1.25, 0.35, 1.125)
+
+# Layout metrics for ``render_vertical_problem``. Only the horizontal extent
+# depends on the operands.
+_CHAR_WIDTH = VERTICAL_FONT_SIZE * 0.6
+_MARGIN = VERTICAL_FONT_SIZE * 0.45
+(
+    _TOP_PADDING,
+    _TEXT_LINE,
+    _BASELINE_GAP,
+    _UNDERLINE_OFFSET,
+    _BOTTOM_PADDING,
+) = (VERTICAL_FONT_SIZE * multiplier for multiplier in VERTICAL_HEIGHT_MULTIPLIERS)
+_TOP_Y = _TOP_PADDING + _TEXT_LINE
+_BOTTOM_Y = _TOP_Y + _BASELINE_GAP
+_LINE_Y = _BOTTOM_Y + _UNDERLINE_OFFSET
+_HEIGHT = _LINE_Y + _BOTTOM_PADDING
+
+# Bounded operand ranges yield a few thousand distinct problems at most, so
+# rendered SVGs repeat heavily within and across worksheets.
+_SVG_CACHE_SIZE = 4096
+
+# Stacked-operand markup with svgwrite's attribute order. Coordinates are written
+# with two decimals, which is well below a rendered pixel.
+VERTICAL_SVG_TEMPLATE = (
+    '<svg baseProfile="full" height="{height:.2f}px" version="1.1" '
+    'viewBox="0,0,{width:.2f},{height:.2f}" width="{width:.2f}px" '
+    'xmlns="http://www.w3.org/2000/svg" '
+    'xmlns:ev="http://www.w3.org/2001/xml-events" '
+    'xmlns:xlink="http://www.w3.org/1999/xlink"><defs />'
+    '<text font-family="{font_family}" font-size="{font_size}px" '
+    'text-anchor="end" x="{anchor_x:.2f}" y="{top_y:.2f}">{top_text}</text>'
+    '<text font-family="{font_family}" font-size="{font_size}px" '
+    'text-anchor="end" x="{anchor_x:.2f}" y="{bottom_y:.2f}">{bottom_text}</text>'
+    '<line stroke="#000000" stroke-width="{rule_width}" x1="{line_start_x:.2f}" '
+    'x2="{line_end_x:.2f}" y1="{line_y:.2f}" y2="{line_y:.2f}" /></svg>'
+)
+
+_TEMPLATE_FIELD_PATTERNS = {
+    "font_family": r'[^"<&]+',
+    "top_text": r"[^<&]*",
+    "bottom_text": r"[^<&]*",
+}
+_NUMBER_PATTERN = r"[\d.]+"
+
+
+def _compile_template_pattern(template: str) -> re.Pattern[str]:
+    """Build a regex matching every string ``template.format`` can produce.
+
+    Each field becomes a named group on first use and a backreference afterwards,
+    so repeated fields (such as the shared ``anchor_x``) must agree.
+
+    Args:
+        template: A ``str.format`` template without conversions.
+
+    Returns:
+        The compiled pattern, intended for use with ``fullmatch``.
+    """
+
+    parts: list[str] = []
+    seen: set[str] = set()
+    for literal, field, _spec, _conversion in Formatter().parse(template):
+        parts.append(re.escape(literal))
+        if field is None:
+            continue
+        if field in seen:
+            parts.append(f"(?P={field})")
+        else:
+            seen.add(field)
+            pattern = _TEMPLATE_FIELD_PATTERNS.get(field, _NUMBER_PATTERN)
+            parts.append(f"(?P<{field}>{pattern})")
+    return re.compile("".join(parts))
+
+
+VERTICAL_SVG_PATTERN = _compile_template_pattern(VERTICAL_SVG_TEMPLATE)
+
+
+def normalize_param_keys(params: Mapping[str, Any] | None) -> dict[str, Any]:
+    """Map external configuration keys to Pydantic field names.
+
+    Args:
+        params: Raw configuration dictionary that may contain hyphenated keys
+            from CLI flags or YAML settings.
+
+    Returns:
+        A new dictionary with hyphenated keys converted to snake_case so they
+        align with the plugin's parameter model; ``params`` itself is never
+        returned. When a key appears in both spellings, the later one wins.
+    """
+
+    if not params:
+        return {}
+    if not any("-" in key for key in params):
+        return dict(params)
+
+    normalized: dict[str, Any] = {}
+    for key, value in params.items():
+        normalized[key.replace("-", "_")] = value
+    return normalized
+
+
+def format_operand(value: int) -> str:
+    """Format an operand for vertical rendering.
+
+    Args:
+        value: The integer operand to render.
+
+    Returns:
+        The operand rendered as a string with negatives wrapped in parentheses
+        to match grade-school formatting expectations.
+    """
+
+    return f"({value})" if value < 0 else str(value)
+
+
+def operand_len(value: int) -> int:
+    """Return ``len(format_operand(value))`` without building the operand text.
+
+    Args:
+        value: The integer operand being measured.
+
+    Returns:
+        The number of characters the operand occupies once rendered.
+    """
+
+    # ``str`` already includes the minus sign; parentheses add two more characters.
+    return len(str(value)) + 2 if value < 0 else len(str(value))
+
+
+def render_vertical_problem(
+    top: int,
+    bottom: int,
+    operator: str,
+    minimum_digit_chars: int | None = None,
+) -> str:
+    """Create a vertically stacked arithmetic SVG illustration.
+
+    Args:
+        top: The top operand shown in the vertical layout.
+        bottom: The bottom operand shown beneath the operator.
+        operator: The arithmetic operator symbol to display between operands.
+        minimum_digit_chars: Optional lower bound for the operand character
+            count when measuring layout width. This keeps rendered problems
+            consistent across varying operand lengths so downstream scaling
+            does not change font sizes.
+
+    Returns:
+        An SVG string matching the dimensions and typography outlined in
+        ``SDD §3.2.3`` so that every stacked-operand plugin stays visually
+        consistent.
+    """
+
+    top_text = format_operand(top)
+    bottom_operand = format_operand(bottom)
+    # ``len(f"{operator} ")`` without building the throwaway string.
+    operator_prefix_chars = len(operator) + 1
+
+    min_char_target = minimum_digit_chars or 0
+    max_operand_chars = max(len(top_text), len(bottom_operand), min_char_target)
+    digit_anchor_x = (
+        _MARGIN
+        + operator_prefix_chars * _CHAR_WIDTH
+        + max_operand_chars * _CHAR_WIDTH
+    )
+    underline_start_x = digit_anchor_x - (
+        (len(bottom_operand) + operator_prefix_chars) * _CHAR_WIDTH
+    )
+
+    return VERTICAL_SVG_TEMPLATE.format(
+        width=digit_anchor_x + _MARGIN,
+        height=_HEIGHT,
+        font_family=VERTICAL_FONT_FAMILY,
+        font_size=VERTICAL_FONT_SIZE,
+        rule_width=VERTICAL_RULE_WIDTH,
+        anchor_x=digit_anchor_x,
+        top_y=_TOP_Y,
+        bottom_y=_BOTTOM_Y,
+        line_start_x=underline_start_x,
+        line_end_x=digit_anchor_x,
+        line_y=_LINE_Y,
+        top_text=top_text,
+        bottom_text=f"{operator} {bottom_operand}",
+    )
+
+
+@lru_cache(maxsize=_SVG_CACHE_SIZE)
+def render_vertical_problem_cached(
+    top: int, bottom: int, operator: str, minimum_digit_chars: int | None
+) -> str:
+    """Return :func:`render_vertical_problem` output memoized per operand set."""
+
+    return render_vertical_problem(
+        top, bottom, operator, minimum_digit_chars=minimum_digit_chars
+    )
@@ -5,137 +5,59 @@ from __future__ import annotations
 import random
 from typing import Any, Mapping
 
-import svgwrite  # type: ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 from ..interface import ParameterDefinition, Problem
+from .common import normalize_param_keys, operand_len, render_vertical_problem_cached
 
 
-_VERTICAL_FONT_SIZE = 34
-_VERTICAL_HEIGHT_MULTIPLIERS = [0.4, 1.0, 1.25, 0.35, 1.125]
-
-
-def _normalize_param_keys(params: Mapping[str, Any] | None) -> dict[str, Any]:
-    """Map external configuration keys to Pydantic field names.
+def _quotient_bounds(
+    divisor: int, min_dividend: int, max_dividend: int
+) -> tuple[int, int]:
+    """Return the quotient range whose multiples of ``divisor`` are valid dividends.
 
     Args:
-        params: Raw configuration dictionary that may contain hyphenated keys
-            from CLI flags or YAML settings.
+        divisor: A positive divisor.
+        min_dividend: Smallest permitted dividend (inclusive).
+        max_dividend: Largest permitted dividend (inclusive).
 
     Returns:
-        A dictionary with hyphenated keys converted to snake_case so they align
-        with the ``_DivisionParams`` model definition.
+        The inclusive ``(low, high)`` quotient bounds. ``low > high`` when no
+        multiple of ``divisor`` lies within the dividend range.
     """
 
-    normalized: dict[str, Any] = {}
-    for key, value in (params or {}).items():
-        normalized[key.replace("-", "_")] = value
-    return normalized
+    return -(-min_dividend // divisor), max_dividend // divisor
 
 
-def _format_operand(value: int) -> str:
-    """Format an operand for vertical rendering.
+def _has_exact_division(
+    min_dividend: int, max_dividend: int, min_divisor: int, max_divisor: int
+) -> bool:
+    """Return ``True`` when some divisor in range evenly divides some dividend.
 
     Args:
-        value: The integer operand to render.
+        min_dividend: Smallest permitted dividend (inclusive).
+        max_dividend: Largest permitted dividend (inclusive).
+        min_divisor: Smallest permitted divisor (inclusive, positive).
+        max_divisor: Largest permitted divisor (inclusive).
 
     Returns:
-        The operand rendered as a string with negatives wrapped in parentheses
-        to match grade-school formatting expectations.
+        Whether a remainder-free problem can be drawn from these bounds.
     """
 
-    return f"({value})" if value < 0 else str(value)
-
-
-def _render_vertical_problem(
-    dividend: int,
-    divisor: int,
-    operator: str,
-    minimum_digit_chars: int | None = None,
-) -> str:
-    """Create a vertically stacked arithmetic SVG illustration for division.
-
-    Args:
-        dividend: The number being divided.
-        divisor: The number by which we divide.
-        operator: The arithmetic operator symbol to display (÷).
-        minimum_digit_chars: Optional lower bound for the operand character
-            count when measuring layout width. This keeps rendered problems
-            consistent across varying operand lengths so downstream scaling
-            does not change font sizes.
-
-    Returns:
-        An SVG string matching the dimensions and typography outlined in
-        ``SDD §3.2.3`` so that division plugins remain visually
-        consistent with other arithmetic plugins.
-    """
-
-    char_width = _VERTICAL_FONT_SIZE * 0.6
-    margin = _VERTICAL_FONT_SIZE * 0.45
-    top_padding = _VERTICAL_FONT_SIZE * 0.4
-    baseline_gap = _VERTICAL_FONT_SIZE * 1.25
-    underline_offset = _VERTICAL_FONT_SIZE * 0.35
-    # Provide extra writing room beneath the underline for student answers.
-    bottom_padding = _VERTICAL_FONT_SIZE * 1.125
-
-    top_y = top_padding + _VERTICAL_FONT_SIZE
-    bottom_y = top_y + baseline_gap
-    line_y = bottom_y + underline_offset
-    height = line_y + bottom_padding
-
-    dividend_text = _format_operand(dividend)
-    divisor_text = _format_operand(divisor)
-    operator_prefix_chars = len(f"{operator} ")
-
-    min_char_target = minimum_digit_chars or 0
-    max_operand_chars = max(len(dividend_text), len(divisor_text), min_char_target)
-    digit_span = max_operand_chars * char_width
-    left_padding = margin + operator_prefix_chars * char_width
-    digit_anchor_x = left_padding + digit_span
-    underline_start_x = digit_anchor_x - (
-        (len(divisor_text) + operator_prefix_chars) * char_width
-    )
-    underline_end_x = digit_anchor_x
-    width = digit_anchor_x + margin
-
-    def _round(value: float) -> float:
-        return round(value, 4)
-
-    drawing = svgwrite.Drawing(
-        size=(f"{_round(width):.2f}px", f"{_round(height):.2f}px"),
-    )
-    drawing.viewbox(0, 0, _round(width), _round(height))
-
-    text_style = {
-        "font_size": f"{_VERTICAL_FONT_SIZE}px",
-        "font_family": "FiraMono, monospace",
-        "text_anchor": "end",
-    }
-
-    drawing.add(
-        drawing.text(
-            dividend_text,
-            insert=(_round(digit_anchor_x), _round(top_y)),
-            **text_style,
-        )
-    )
-    drawing.add(
-        drawing.text(
-            f"{operator} {divisor_text}",
-            insert=(_round(digit_anchor_x), _round(bottom_y)),
-            **text_style,
-        )
-    )
-    drawing.add(
-        drawing.line(
-            start=(_round(underline_start_x), _round(line_y)),
-            end=(_round(underline_end_x), _round(line_y)),
-            stroke="#000000",
-            stroke_width=2,
-        )
-    )
-
-    return drawing.tostring()
+    # Zero is a multiple of everything, and any run of ``d`` consecutive integers
+    # contains a multiple of ``d``.
+    if min_dividend <= 0 <= max_dividend:
+        return True
+    if max_dividend - min_dividend + 1 >= min_divisor:
+        return True
+    # Otherwise every dividend is non-zero, so divisors larger than the biggest
+    # magnitude cannot divide any of them.
+    largest = min(max_divisor, max(abs(min_dividend), abs(max_dividend)))
+    for divisor in range(min_divisor, largest + 1):
+        low, high = _quotient_bounds(divisor, min_dividend, max_dividend)
+        if low <= high:
+            return True
+    return False
 
 
 class _DivisionParams(BaseModel):
@@ -181,6 +103,11 @@ class _DivisionParams(BaseModel):
         if self.min_divisor <= 0:
             msg = "min_divisor must be greater than 0"
             raise ValueError(msg)
+        if not self.allow_remainders and not _has_exact_division(
+            self.min_dividend, self.max_dividend, self.min_divisor, self.max_divisor
+        ):
+            msg = "no dividend in range is evenly divisible by a divisor in range"
+            raise ValueError(msg)
         return self
 
 
@@ -278,7 +205,7 @@ class DivisionPlugin:
         """
 
         try:
-            self._config = _DivisionParams.model_validate(_normalize_param_keys(params))
+            self._config = _DivisionParams.model_validate(normalize_param_keys(params))
         except ValidationError as exc:  # pragma: no cover - defensive rewrap
             raise ValueError("Invalid division plugin parameters") from exc
 
@@ -288,10 +215,10 @@ class DivisionPlugin:
 
         # Calculate minimum digit characters for consistent rendering
         self._min_digit_chars = max(
-            len(_format_operand(self._config.min_dividend)),
-            len(_format_operand(self._config.max_dividend)),
-            len(_format_operand(self._config.min_divisor)),
-            len(_format_operand(self._config.max_divisor)),
+            operand_len(self._config.min_dividend),
+            operand_len(self._config.max_dividend),
+            operand_len(self._config.min_divisor),
+            operand_len(self._config.max_divisor),
         )
 
     @property
@@ -372,11 +299,11 @@ class DivisionPlugin:
 
         dividend, divisor, quotient, remainder = _sample_valid_division()
 
-        svg = _render_vertical_problem(
+        svg = render_vertical_problem_cached(
             dividend,
             divisor,
             "÷",
-            minimum_digit_chars=self._min_digit_chars,
+            self._min_digit_chars,
         )
         answer_str = str(quotient) if remainder == 0 else f"{quotient} r {remainder}"
         data = {
@@ -388,7 +315,7 @@ class DivisionPlugin:
             "answer": answer_str,
             "min_digit_chars": self._min_digit_chars,
         }
-        return Problem(svg=svg, data=data)
+        return Problem.model_construct(svg=svg, data=data)
 
     @classmethod
     def generate_from_data(cls, data: Mapping[str, Any]) -> Problem:
@@ -407,7 +334,7 @@ class DivisionPlugin:
         """
 
         try:
-            validated = _DivisionData.model_validate(dict(data))
+            validated = _DivisionData.model_validate(data)
         except ValidationError as exc:  # pragma: no cover - defensive rewrap
             raise ValueError("Invalid division problem data") from exc
 
@@ -415,16 +342,13 @@ class DivisionPlugin:
         divisor = validated.divisor
         min_digit_chars = validated.min_digit_chars
         if min_digit_chars is None:
-            min_digit_chars = max(
-                len(_format_operand(dividend)),
-                len(_format_operand(divisor)),
-            )
+            min_digit_chars = max(operand_len(dividend), operand_len(divisor))
 
-        svg = _render_vertical_problem(
+        svg = render_vertical_problem_cached(
             dividend,
             divisor,
             "÷",
-            minimum_digit_chars=min_digit_chars,
+            min_digit_chars,
         )
         payload = validated.model_dump()
         return Problem(svg=svg, data=payload)
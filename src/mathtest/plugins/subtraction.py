@@ -5,133 +5,10 @@ from __future__ import annotations
 import random
 from typing import Any, Mapping
 
-import svgwrite  # type: ignore[import-untyped]
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
 
 from ..interface import ParameterDefinition, Problem
-
-
-def _normalize_param_keys(params: Mapping[str, Any] | None) -> dict[str, Any]:
-    """Map external configuration keys to Pydantic field names.
-
-    Args:
-        params: Raw configuration dictionary that may contain hyphenated keys
-            sourced from CLI flags or YAML configuration files.
-
-    Returns:
-        A dictionary containing only snake_case keys so that
-        ``_SubtractionParams`` can validate the input.
-    """
-
-    normalized: dict[str, Any] = {}
-    for key, value in (params or {}).items():
-        normalized[key.replace("-", "_")] = value
-    return normalized
-
-
-def _format_operand(value: int) -> str:
-    """Render operands with parentheses when negative for readability.
-
-    Args:
-        value: The operand to render in the vertical layout.
-
-    Returns:
-        The operand converted to a string with negative values wrapped in
-        parentheses to preserve alignment and clarity.
-    """
-
-    return f"({value})" if value < 0 else str(value)
-
-
-def _render_vertical_problem(
-    top: int,
-    bottom: int,
-    operator: str,
-    minimum_digit_chars: int | None = None,
-) -> str:
-    """Create a vertically stacked subtraction SVG (SDD §3.2.3).
-
-    Args:
-        top: The top operand shown in the rendered SVG.
-        bottom: The bottom operand displayed beneath the operator.
-        operator: The arithmetic symbol used to label the operation.
-        minimum_digit_chars: Optional lower bound for the operand character
-            count when measuring width. Providing a value keeps font sizes
-            consistent when downstream consumers scale the SVG to fill layout
-            columns.
-
-    Returns:
-        An SVG string that follows the shared layout specifications so worksheets
-        have consistent typography and spacing across plugins.
-    """
-
-    font_size = 34
-    char_width = font_size * 0.6
-    margin = font_size * 0.45
-    top_padding = font_size * 0.4
-    baseline_gap = font_size * 1.25
-    underline_offset = font_size * 0.35
-    # Provide extra writing room beneath the underline for student answers.
-    bottom_padding = font_size * 1.125
-
-    top_y = top_padding + font_size
-    bottom_y = top_y + baseline_gap
-    line_y = bottom_y + underline_offset
-    height = line_y + bottom_padding
-
-    top_text = _format_operand(top)
-    bottom_operand = _format_operand(bottom)
-    operator_prefix_chars = len(f"{operator} ")
-
-    min_char_target = minimum_digit_chars or 0
-    max_operand_chars = max(len(top_text), len(bottom_operand), min_char_target)
-    digit_span = max_operand_chars * char_width
-    left_padding = margin + operator_prefix_chars * char_width
-    digit_anchor_x = left_padding + digit_span
-    underline_start_x = digit_anchor_x - (
-        (len(bottom_operand) + operator_prefix_chars) * char_width
-    )
-    underline_end_x = digit_anchor_x
-    width = digit_anchor_x + margin
-
-    def _round(value: float) -> float:
-        return round(value, 4)
-
-    drawing = svgwrite.Drawing(
-        size=(f"{_round(width):.2f}px", f"{_round(height):.2f}px"),
-    )
-    drawing.viewbox(0, 0, _round(width), _round(height))
-
-    text_style = {
-        "font_size": f"{font_size}px",
-        "font_family": "FiraMono, monospace",
-        "text_anchor": "end",
-    }
-
-    drawing.add(
-        drawing.text(
-            top_text,
-            insert=(_round(digit_anchor_x), _round(top_y)),
-            **text_style,
-        )
-    )
-    drawing.add(
-        drawing.text(
-            f"{operator} {bottom_operand}",
-            insert=(_round(digit_anchor_x), _round(bottom_y)),
-            **text_style,
-        )
-    )
-    drawing.add(
-        drawing.line(
-            start=(_round(underline_start_x), _round(line_y)),
-            end=(_round(underline_end_x), _round(line_y)),
-            stroke="#000000",
-            stroke_width=2,
-        )
-    )
-
-    return drawing.tostring()
+from .common import format_operand, normalize_param_keys, render_vertical_problem
 
 
 class _SubtractionParams(BaseModel):
@@ -224,7 +101,7 @@ class SubtractionPlugin:
 
         try:
             self._config = _SubtractionParams.model_validate(
-                _normalize_param_keys(params)
+                normalize_param_keys(params)
             )
         except ValidationError as exc:  # pragma: no cover - defensive rewrap
             raise ValueError("Invalid subtraction plugin parameters") from exc
@@ -233,8 +110,8 @@ class SubtractionPlugin:
         if self._config.random_seed is not None:
             self._random.seed(self._config.random_seed)
         self._min_digit_chars = max(
-            len(_format_operand(self._config.min_operand)),
-            len(_format_operand(self._config.max_operand)),
+            len(format_operand(self._config.min_operand)),
+            len(format_operand(self._config.max_operand)),
         )
 
     @property
@@ -299,7 +176,7 @@ class SubtractionPlugin:
 
         answer = minuend - subtrahend
 
-        svg = _render_vertical_problem(
+        svg = render_vertical_problem(
             minuend,
             subtrahend,
             "-",
@@ -329,7 +206,7 @@ class SubtractionPlugin:
         """
 
         try:
-            validated = _SubtractionData.model_validate(dict(data))
+            validated = _SubtractionData.model_validate(data)
         except ValidationError as exc:  # pragma: no cover - defensive rewrap
             raise ValueError("Invalid subtraction problem data") from exc
 
@@ -337,10 +214,10 @@ class SubtractionPlugin:
         min_digit_chars = validated.min_digit_chars
         if min_digit_chars is None:
             min_digit_chars = max(
-                len(_format_operand(value)) for value in validated.operands
+                len(format_operand(value)) for value in validated.operands
             )
 
-        svg = _render_vertical_problem(
+        svg = render_vertical_problem(
             minuend,
             subtrahend,
             "-",
@@ -0,0 +1,32 @@
+"""Shared fixtures for Mathtest tests."""
+
+import base64
+from collections.abc import Callable
+from pathlib import Path
+import re
+import zlib
+
+import pytest
+
+_PDF_STREAM_PATTERN = re.compile(rb"stream\r?\n(.*?)endstream", re.DOTALL)
+
+
+def _inflate_stream(raw: bytes) -> bytes:
+    """Decode an ASCII85 + Flate content stream, returning ``raw`` otherwise."""
+
+    try:
+        return zlib.decompress(base64.a85decode(raw.strip().removesuffix(b"~>")))
+    except (ValueError, zlib.error):
+        return raw
+
+
+@pytest.fixture
+def read_pdf_content() -> Callable[[Path], bytes]:
+    """Return a reader exposing PDF text even when content streams are compressed."""
+
+    def _read(path: Path) -> bytes:
+        data = path.read_bytes()
+        streams = _PDF_STREAM_PATTERN.findall(data)
+        return data + b"".join(_inflate_stream(stream) for stream in streams)
+
+    return _read
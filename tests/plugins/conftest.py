@@ -7,14 +7,9 @@ import xml.etree.ElementTree as ET
 
 import pytest
 
-from mathtest.plugins.addition import (
-    _VERTICAL_FONT_SIZE,
-    _VERTICAL_HEIGHT_MULTIPLIERS,
-)
-
-EXPECTED_VERTICAL_PROBLEM_HEIGHT = _VERTICAL_FONT_SIZE * sum(
-    _VERTICAL_HEIGHT_MULTIPLIERS
-)
+from mathtest.plugins.common import VERTICAL_FONT_SIZE, VERTICAL_HEIGHT_MULTIPLIERS
+
+EXPECTED_VERTICAL_PROBLEM_HEIGHT = VERTICAL_FONT_SIZE * sum(VERTICAL_HEIGHT_MULTIPLIERS)
 
 
 @pytest.fixture
@@ -1,5 +1,7 @@
 """Smoke tests for the addition plugin."""
 
+import pytest
+
 from mathtest.plugins.addition import AdditionPlugin
 
 
@@ -16,3 +18,27 @@ def test_addition_plugin_generates_expected_problem(
 
     recreated = AdditionPlugin.generate_from_data(problem.data)
     assert recreated.data == problem.data
+
+
+def test_addition_from_data_fast_path_matches_validated_payload() -> None:
+    """Trusted payloads and loosely typed payloads should rebuild the same problem."""
+
+    trusted = {"operands": [12, 7], "operator": "+", "answer": 19, "min_digit_chars": 2}
+    loose = {"operands": ["12", "7"], "min_digit_chars": 2}
+
+    fast = AdditionPlugin.generate_from_data(trusted)
+    validated = AdditionPlugin.generate_from_data(loose)
+
+    assert fast.data == validated.data == trusted
+    assert fast.svg == validated.svg
+
+    with pytest.raises(ValueError):
+        AdditionPlugin.generate_from_data({**trusted, "answer": 20})
+
+
+def test_addition_plugin_seeded_operands_are_pinned() -> None:
+    """Seeded worksheets must keep reproducing the historical ``randint`` draws."""
+
+    plugin = AdditionPlugin({"random-seed": 7})
+    first = [plugin.generate_problem().data["operands"] for _ in range(5)]
+    assert first == [[5, 2], [6, 10], [0, 1], [8, 1], [5, 9]]
@@ -52,3 +52,12 @@ def test_clock_plugin_supports_accurate_hour_and_24_hour_modes() -> None:
     assert military_problem.data["hour"] == 14
     assert military_problem.data["minute"] == 0
     assert military_problem.data["answer"] == "14:00"
+
+
+def test_clock_plugin_accepts_snake_case_parameters() -> None:
+    """Snake_case keys should configure the plugin just like hyphenated ones."""
+
+    hyphenated = ClockPlugin({"random-seed": 11, "clock-24-hour": True})
+    snake_case = ClockPlugin({"random_seed": 11, "clock_24_hour": True})
+
+    assert snake_case.generate_problem().data == hyphenated.generate_problem().data
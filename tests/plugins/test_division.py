@@ -1,5 +1,7 @@
 """Smoke tests for the division plugin."""
 
+import pytest
+
 from mathtest.plugins.division import DivisionPlugin
 
 
@@ -24,3 +26,52 @@ def test_division_plugin_generates_expected_problem(
 
     recreated = DivisionPlugin.generate_from_data(problem.data)
     assert recreated.data == problem.data
+
+
+def test_division_plugin_without_remainders_draws_exact_multiples() -> None:
+    """Remainder-free problems should only use dividends divisible by the divisor."""
+
+    bounds = {
+        "min-dividend": -7,
+        "max-dividend": 20,
+        "min-divisor": 1,
+        "max-divisor": 6,
+    }
+    plugin = DivisionPlugin({**bounds, "random-seed": 3})
+    for _ in range(200):
+        data = plugin.generate_problem().data
+        assert -7 <= data["dividend"] <= 20
+        assert 1 <= data["divisor"] <= 6
+        assert data["remainder"] == 0
+        assert data["quotient"] * data["divisor"] == data["dividend"]
+
+
+def test_division_plugin_seeded_output_is_pinned() -> None:
+    """Seeded remainder-free worksheets must reproduce the same problems."""
+
+    plugin = DivisionPlugin({"random-seed": 7})
+    pairs = [
+        (problem.data["dividend"], problem.data["divisor"])
+        for problem in (plugin.generate_problem() for _ in range(4))
+    ]
+
+    assert pairs == [(42, 3), (51, 1), (75, 1), (56, 7)]
+
+
+@pytest.mark.parametrize(("min_divisor", "max_divisor"), [(2, 2), (4, 100_000)])
+def test_division_plugin_rejects_ranges_without_exact_multiples(
+    min_divisor: int, max_divisor: int
+) -> None:
+    """Bounds that cannot produce a remainder-free problem should fail fast."""
+
+    with pytest.raises(ValueError) as excinfo:
+        DivisionPlugin(
+            {
+                "min-dividend": 3,
+                "max-dividend": 3,
+                "min-divisor": min_divisor,
+                "max-divisor": max_divisor,
+            }
+        )
+
+    assert "evenly divisible" in str(excinfo.value.__cause__)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import json
 from pathlib import Path
 
@@ -201,7 +202,9 @@ def test_cli_inserts_generate_prefix_for_flags(tmp_path: Path) -> None:
     assert pdf_path.exists()
 
 
-def test_cli_answer_key_flag_controls_pdf_section(tmp_path: Path) -> None:
+def test_cli_answer_key_flag_controls_pdf_section(
+    tmp_path: Path, read_pdf_content: Callable[[Path], bytes]
+) -> None:
     """The answer key should only render when the dedicated flag is provided."""
 
     runner = CliRunner()
@@ -225,7 +228,7 @@ def test_cli_answer_key_flag_controls_pdf_section(tmp_path: Path) -> None:
 
     assert without_result.exit_code == 0, without_result.output
     assert without_path.exists()
-    assert b"Answer Key" not in without_path.read_bytes()
+    assert b"Answer Key" not in read_pdf_content(without_path)
 
     with_path = tmp_path / "with.pdf"
     with_result = _invoke(
@@ -240,7 +243,7 @@ def test_cli_answer_key_flag_controls_pdf_section(tmp_path: Path) -> None:
 
     assert with_result.exit_code == 0, with_result.output
     assert with_path.exists()
-    assert b"Answer Key" in with_path.read_bytes()
+    assert b"Answer Key" in read_pdf_content(with_path)
 
 
 def test_cli_generates_clock_problems(tmp_path: Path) -> None:
@@ -9,6 +9,8 @@ from mathtest.coordinator import (
     PluginRequest,
 )
 from mathtest.plugins.addition import AdditionPlugin
+from mathtest.plugins.clock import ClockPlugin
+from mathtest.plugins.division import DivisionPlugin
 from mathtest.plugins.subtraction import SubtractionPlugin
 from mathtest.plugins.multiplication import MultiplicationPlugin
 from mathtest.registry import PluginRegistry
@@ -80,3 +82,30 @@ def test_coordinator_recreates_from_serialized_input() -> None:
     assert [problem.data for problem in reproduced.problems] == [
         problem.data for problem in initial_result.problems
     ]
+
+
+def test_coordinator_accepts_snake_case_keys_alongside_defaults() -> None:
+    """Snake_case YAML keys should override the hyphenated parameter defaults."""
+
+    registry = PluginRegistry(
+        plugins={"clock": ClockPlugin, "division": DivisionPlugin}
+    )
+    coordinator = Coordinator(registry=registry)
+    request = GenerationRequest(
+        plugin_requests=[
+            PluginRequest(name="clock", quantity=1),
+            PluginRequest(name="division", quantity=1),
+        ],
+        yaml_parameters=ParameterSet(
+            plugins={
+                "clock": {"random_seed": 4, "minute_interval": 60},
+                "division": {"max_divisor": 1, "random_seed": 2},
+            }
+        ),
+    )
+
+    result = coordinator.generate(request)
+
+    by_type = {entry.problem_type: entry.data for entry in result.serialized}
+    assert by_type["clock"]["minute"] == 0
+    assert by_type["division"]["divisor"] == 1
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 import io
 from pathlib import Path
+from typing import Any
 
 
 def _build_text_svg(
@@ -27,12 +29,18 @@ def _build_text_svg(
 
 import pytest
 
+from reportlab.graphics.shapes import Group, Line, String, mmult, transformPoint
 from reportlab.lib.pagesizes import letter
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from svglib import svglib
 
 from mathtest.interface import Problem
 from mathtest.output import PdfOutputGenerator
-from mathtest.output.pdf import PdfOutputParams
+from mathtest.output.pdf import PdfOutputParams, _parse_vertical_problem
 from mathtest.plugins.addition import AdditionPlugin
+from mathtest.plugins.division import DivisionPlugin
+from mathtest.plugins.multiplication import MultiplicationPlugin
+from mathtest.plugins.subtraction import SubtractionPlugin
 
 
 @pytest.fixture()
@@ -44,7 +52,7 @@ def sample_problems() -> list:
 
 
 def test_pdf_output_creates_file_with_answer_key(
-    tmp_path: Path, sample_problems: list
+    tmp_path: Path, sample_problems: list, read_pdf_content: Callable[[Path], bytes]
 ) -> None:
     """PDF generator should produce a non-empty file when the key is enabled."""
 
@@ -58,7 +66,7 @@ def test_pdf_output_creates_file_with_answer_key(
     assert output_path.exists()
     assert output_path.stat().st_size > 0
 
-    pdf_bytes = output_path.read_bytes()
+    pdf_bytes = read_pdf_content(output_path)
     assert b"Answer Key" in pdf_bytes
     assert b"1. " in pdf_bytes  # Basic confirmation that answers are listed
     assert b"Name:" in pdf_bytes
@@ -66,7 +74,7 @@ def test_pdf_output_creates_file_with_answer_key(
 
 
 def test_pdf_output_omits_answer_key_when_disabled(
-    tmp_path: Path, sample_problems: list
+    tmp_path: Path, sample_problems: list, read_pdf_content: Callable[[Path], bytes]
 ) -> None:
     """Answer key content should be absent unless explicitly requested."""
 
@@ -76,12 +84,12 @@ def test_pdf_output_omits_answer_key_when_disabled(
     generator.generate(sample_problems, {"path": output_path})
 
     assert output_path.exists()
-    pdf_bytes = output_path.read_bytes()
+    pdf_bytes = read_pdf_content(output_path)
     assert b"Answer Key" not in pdf_bytes
 
 
 def test_pdf_output_can_disable_student_header(
-    tmp_path: Path, sample_problems: list
+    tmp_path: Path, sample_problems: list, read_pdf_content: Callable[[Path], bytes]
 ) -> None:
     """Student metadata fields should be optional via configuration."""
 
@@ -93,11 +101,44 @@ def test_pdf_output_can_disable_student_header(
         {"path": output_path, "include_student_header": False},
     )
 
-    pdf_bytes = output_path.read_bytes()
+    pdf_bytes = read_pdf_content(output_path)
     assert b"Name:" not in pdf_bytes
     assert b"Date:" not in pdf_bytes
 
 
+def test_pdf_output_compress_flag_controls_stream_encoding(
+    tmp_path: Path, sample_problems: list
+) -> None:
+    """Content streams should be deflated by default and plain when disabled."""
+
+    generator = PdfOutputGenerator()
+    compressed_path = tmp_path / "compressed.pdf"
+    plain_path = tmp_path / "plain.pdf"
+
+    generator.generate(sample_problems, {"path": compressed_path})
+    generator.generate(sample_problems, {"path": plain_path, "compress": False})
+
+    assert b"/FlateDecode" in compressed_path.read_bytes()
+    assert b"/FlateDecode" not in plain_path.read_bytes()
+    assert b"Name:" in plain_path.read_bytes()
+
+
+def test_pdf_output_stamps_title_form_on_each_page(tmp_path: Path) -> None:
+    """Multi-page worksheets should draw the title block once and reuse it."""
+
+    plugin = AdditionPlugin({"random_seed": 1})
+    problems = [plugin.generate_problem() for _ in range(60)]
+    output_path = tmp_path / "multi_page.pdf"
+
+    PdfOutputGenerator().generate(problems, {"path": output_path, "compress": False})
+
+    pdf_bytes = output_path.read_bytes()
+    page_count = pdf_bytes.count(b"/Type /Page\n")
+    assert page_count > 1
+    assert pdf_bytes.count(b"Name:") == 1
+    assert pdf_bytes.count(b"/FormXob.mathtest-title Do") == page_count
+
+
 def test_pdf_output_requires_path(sample_problems: list) -> None:
     """Missing required parameters should raise a ``ValueError``."""
 
@@ -134,8 +175,8 @@ def test_pdf_output_uses_svg2rlg_drawings(
         assert x == 0 and y == 0
         matrices.append(canvas._currentMatrix)
 
-    monkeypatch.setattr("mathtest.output.pdf.svg2rlg", fake_svg2rlg)
-    monkeypatch.setattr("mathtest.output.pdf.renderPDF.draw", fake_render)
+    monkeypatch.setattr("svglib.svglib.svg2rlg", fake_svg2rlg)
+    monkeypatch.setattr("reportlab.graphics.renderPDF.draw", fake_render)
 
     generator.generate([problem], {"path": output_path})
 
@@ -164,6 +205,135 @@ def test_pdf_output_uses_svg2rlg_drawings(
     assert top_position > expected_bottom
 
 
+def test_pdf_output_parses_duplicate_svgs_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Identical problem SVGs should share a single parsed drawing across runs."""
+
+    problems = [
+        Problem(svg=_build_text_svg(80, 40, "4 + 4"), data={"answer": 8})
+        for _ in range(5)
+    ]
+    parsed: list[str] = []
+    real_svg2rlg = svglib.svg2rlg
+
+    def counting_svg2rlg(stream: io.StringIO):
+        parsed.append(stream.getvalue())
+        return real_svg2rlg(stream)
+
+    monkeypatch.setattr("svglib.svglib.svg2rlg", counting_svg2rlg)
+
+    output_path = tmp_path / "duplicates.pdf"
+    generator = PdfOutputGenerator()
+    generator.generate(problems, {"path": output_path})
+    generator.generate(problems, {"path": tmp_path / "again.pdf"})
+
+    assert output_path.exists()
+    assert parsed == [problems[0].svg]
+
+
+def test_pdf_output_draws_plugin_problems_without_svglib(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Stacked-operand plugin SVGs should be drawn natively, skipping svg2rlg."""
+
+    def fail_svg2rlg(stream: io.StringIO) -> None:
+        raise AssertionError("svg2rlg should not be used for plugin problems")
+
+    monkeypatch.setattr("svglib.svglib.svg2rlg", fail_svg2rlg)
+
+    plugin = AdditionPlugin({"random_seed": 5})
+    problems = [plugin.generate_problem() for _ in range(4)]
+    output_path = tmp_path / "native.pdf"
+
+    PdfOutputGenerator().generate(problems, {"path": output_path, "compress": False})
+
+    pdf_bytes = output_path.read_bytes()
+    for problem in problems:
+        top, bottom = problem.data["operands"]
+        assert f"({top}) Tj".encode() in pdf_bytes
+        assert f"(+ {bottom}) Tj".encode() in pdf_bytes
+
+
+@pytest.mark.parametrize(
+    "plugin_cls", [SubtractionPlugin, MultiplicationPlugin, DivisionPlugin]
+)
+def test_pdf_output_draws_other_stacked_plugins_without_svglib(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, plugin_cls: type
+) -> None:
+    """Every stacked-operand plugin should take the native drawing path."""
+
+    def fail_svg2rlg(stream: io.StringIO) -> None:
+        raise AssertionError("svg2rlg should not be used for plugin problems")
+
+    monkeypatch.setattr("svglib.svglib.svg2rlg", fail_svg2rlg)
+
+    plugin = plugin_cls({"random_seed": 5})
+    problems = [plugin.generate_problem() for _ in range(4)]
+    output_path = tmp_path / "native.pdf"
+
+    PdfOutputGenerator().generate(problems, {"path": output_path, "compress": False})
+
+    # Two operand rows per problem plus the title, "Name:", and "Date:" runs
+    # recorded once in the title form.
+    assert output_path.read_bytes().count(b") Tj") == 2 * len(problems) + 3
+
+
+@pytest.mark.parametrize(
+    ("plugin_cls", "params"),
+    [
+        (AdditionPlugin, {"min-operand": -120, "max-operand": -100}),
+        (SubtractionPlugin, {"random_seed": 4}),
+        (MultiplicationPlugin, {"random_seed": 4}),
+        (DivisionPlugin, {"random_seed": 4}),
+    ],
+)
+def test_native_vertical_problem_matches_svglib_geometry(
+    plugin_cls: type, params: dict[str, int]
+) -> None:
+    """Native drawing should place text and the rule exactly where svglib does."""
+
+    problem = plugin_cls(params).generate_problem()
+    native = _parse_vertical_problem(problem.svg)
+    assert native is not None
+    drawing = svglib.svg2rlg(io.StringIO(problem.svg))
+
+    texts: list[tuple[float, float, str, str, float]] = []
+    rules: list[tuple[float, float, float, float, float]] = []
+
+    def collect(node: Any, matrix: tuple[float, ...]) -> None:
+        if isinstance(node, Group):
+            matrix = mmult(matrix, node.transform)
+            for child in node.contents:
+                collect(child, matrix)
+        elif isinstance(node, String):
+            assert node.textAnchor == "end"
+            start = node.x - stringWidth(node.text, node.fontName, node.fontSize)
+            x, y = transformPoint(matrix, (start, node.y))
+            texts.append((x, y, node.text, node.fontName, node.fontSize * matrix[0]))
+        elif isinstance(node, Line):
+            x1, y1 = transformPoint(matrix, (node.x1, node.y1))
+            x2, y2 = transformPoint(matrix, (node.x2, node.y2))
+            rules.append((x1, y1, x2, y2, node.strokeWidth * matrix[0]))
+
+    collect(drawing, (1, 0, 0, 1, 0, 0))
+
+    assert native.width == pytest.approx(drawing.width)
+    assert native.height == pytest.approx(drawing.height)
+    assert len(texts) == len(native.text_runs) == 2
+    for (x, y, value), (svg_x, svg_y, svg_value, font_name, font_size) in zip(
+        native.text_runs, texts
+    ):
+        assert value == svg_value
+        assert (x, y) == pytest.approx((svg_x, svg_y))
+        assert native.font_name == font_name
+        assert native.font_size == pytest.approx(font_size)
+    assert len(rules) == 1
+    *rule, rule_width = rules[0]
+    assert native.rule == pytest.approx(tuple(rule))
+    assert native.rule_width == pytest.approx(rule_width)
+
+
 def test_pdf_output_columns_layout(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -185,29 +355,33 @@ def test_pdf_output_columns_layout(
             self.width = float(width)
             self.height = float(height)
 
-    draw_specs = [(120.0, 48.0) for _ in range(len(problems) - 1)] + [(40.0, 24.0)]
-    drawings: list[MockDrawing] = []
+    # Plugin problems are drawn natively; only the hand-built SVG uses svglib.
+    drawings: list[Any] = []
     matrices: list[tuple[float, float, float, float, float, float]] = []
 
     def fake_svg2rlg(stream: io.StringIO) -> MockDrawing:
         assert isinstance(stream, io.StringIO)
-        width, height = draw_specs[len(drawings)]
-        drawing = MockDrawing(width, height)
-        drawings.append(drawing)
-        return drawing
+        return MockDrawing(40.0, 24.0)
 
     def fake_render(drawing: MockDrawing, canvas, x: float, y: float) -> None:
         assert x == 0 and y == 0
+        drawings.append(drawing)
+        matrices.append(canvas._currentMatrix)
+
+    def record_native(drawing: Any, canvas) -> None:
+        drawings.append(drawing)
         matrices.append(canvas._currentMatrix)
 
-    monkeypatch.setattr("mathtest.output.pdf.svg2rlg", fake_svg2rlg)
-    monkeypatch.setattr("mathtest.output.pdf.renderPDF.draw", fake_render)
+    monkeypatch.setattr("svglib.svglib.svg2rlg", fake_svg2rlg)
+    monkeypatch.setattr("reportlab.graphics.renderPDF.draw", fake_render)
+    monkeypatch.setattr("mathtest.output.pdf._VerticalProblem.draw", record_native)
 
     generator.generate(problems, {"path": output_path})
 
     assert output_path.exists()
     assert matrices
     assert len(drawings) == len(problems)
+    assert sum(isinstance(drawing, MockDrawing) for drawing in drawings) == 1
     config = PdfOutputParams(path=output_path)
 
     page_width, _ = letter